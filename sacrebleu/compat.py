@@ -1,44 +1,90 @@
-from typing import Sequence, Optional
+from functools import lru_cache
+from typing import Iterable, Sequence, Optional, Tuple
 
 from .metrics import BLEU, CHRF, TER, BLEUScore, CHRFScore, TERScore
 
 
+def _as_sequences(hypotheses: Iterable[str],
+                  references: Iterable[Iterable[str]]) -> Tuple[Sequence[str], Sequence[Sequence[str]]]:
+    """Materializes the given hypotheses and reference streams into lists
+    if they are one-shot iterables such as generators, so that the metrics
+    can check and traverse them.
+
+    :param hypotheses: An iterable of hypothesis strings.
+    :param references: An iterable of reference streams.
+    :return: A tuple of hypotheses and references as sequences.
+    """
+    hyps = hypotheses if isinstance(hypotheses, Sequence) else list(hypotheses)
+
+    refs: Sequence[Sequence[str]]
+    if isinstance(references, Sequence) and \
+            all(isinstance(stream, Sequence) for stream in references):
+        refs = references
+    else:
+        refs = [stream if isinstance(stream, Sequence) else list(stream)
+                for stream in references]
+
+    return hyps, refs
+
+
+# Metric objects are cached by their configuration so that repeated calls,
+# e.g. `sentence_bleu()` in a loop, reuse the same instance along with
+# its warmed-up tokenizer caches.
+@lru_cache(maxsize=32)
+def _get_bleu(**kwargs) -> BLEU:
+    return BLEU(**kwargs)
+
+
+@lru_cache(maxsize=32)
+def _get_chrf(**kwargs) -> CHRF:
+    return CHRF(**kwargs)
+
+
+@lru_cache(maxsize=32)
+def _get_ter(**kwargs) -> TER:
+    return TER(**kwargs)
+
+
 ######################################################################
 # Backward compatibility functions for old style API access (< 1.4.11)
 ######################################################################
-def corpus_bleu(hypotheses: Sequence[str],
-                references: Sequence[Sequence[str]],
+def corpus_bleu(hypotheses: Iterable[str],
+                references: Iterable[Iterable[str]],
                 smooth_method='exp',
                 smooth_value=None,
                 force=False,
                 lowercase=False,
                 tokenize=BLEU.TOKENIZER_DEFAULT,
-                use_effective_order=False) -> BLEUScore:
+                use_effective_order=False,
+                n_jobs: int = 1) -> BLEUScore:
     """Computes BLEU for a corpus against a single (or multiple) reference(s).
     This is the main CLI entry point for computing BLEU between a system output
     and a reference sentence.
 
-    :param hypotheses: A sequence of hypothesis strings.
-    :param references: A sequence of reference documents with document being
-        defined as a sequence of reference strings.
+    :param hypotheses: An iterable of hypothesis strings, e.g. a list or a generator.
+    :param references: An iterable of reference documents with document being
+        defined as an iterable of reference strings.
     :param smooth_method: The smoothing method to use ('floor', 'add-k', 'exp' or 'none')
     :param smooth_value: The smoothing value for `floor` and `add-k` methods. `None` falls back to default value.
     :param force: Ignore data that looks already tokenized
     :param lowercase: Lowercase the data
     :param tokenize: The tokenizer to use
     :param use_effective_order: Don't take into account n-gram orders without any match.
+    :param n_jobs: The number of worker processes to extract segment statistics with.
+        If 0, half of the available CPUs will be used.
     :return: a `BLEUScore` object
     """
-    metric = BLEU(
+    metric = _get_bleu(
         lowercase=lowercase, force=force, tokenize=tokenize,
         smooth_method=smooth_method, smooth_value=smooth_value,
         effective_order=use_effective_order)
 
-    return metric.corpus_score(hypotheses, references)
+    hyps, refs = _as_sequences(hypotheses, references)
+    return metric.corpus_score(hyps, refs, n_jobs=n_jobs)
 
 
-def raw_corpus_bleu(hypotheses: Sequence[str],
-                    references: Sequence[Sequence[str]],
+def raw_corpus_bleu(hypotheses: Iterable[str],
+                    references: Iterable[Iterable[str]],
                     smooth_value: Optional[float] = BLEU.SMOOTH_DEFAULTS['floor']) -> BLEUScore:
     """Computes BLEU for a corpus against a single (or multiple) reference(s).
     This convenience function assumes a particular set of arguments i.e.
@@ -48,9 +94,9 @@ def raw_corpus_bleu(hypotheses: Sequence[str],
     neither to the system output nor the reference. It just computes
     BLEU on the "raw corpus" (hence the name).
 
-    :param hypotheses: A sequence of hypothesis strings.
-    :param references: A sequence of reference documents with document being
-        defined as a sequence of reference strings.
+    :param hypotheses: An iterable of hypothesis strings, e.g. a list or a generator.
+    :param references: An iterable of reference documents with document being
+        defined as an iterable of reference strings.
     :param smooth_value: The smoothing value for `floor`. If not given, the default of 0.1 is used.
     :return: Returns a `BLEUScore` object.
 
@@ -83,7 +129,7 @@ def sentence_bleu(hypothesis: str,
     :param use_effective_order: Don't take into account n-gram orders without any match.
     :return: Returns a `BLEUScore` object.
     """
-    metric = BLEU(
+    metric = _get_bleu(
         lowercase=lowercase, tokenize=tokenize, force=False,
         smooth_method=smooth_method, smooth_value=smooth_value,
         effective_order=use_effective_order)
@@ -91,20 +137,21 @@ def sentence_bleu(hypothesis: str,
     return metric.sentence_score(hypothesis, references)
 
 
-def corpus_chrf(hypotheses: Sequence[str],
-                references: Sequence[Sequence[str]],
+def corpus_chrf(hypotheses: Iterable[str],
+                references: Iterable[Iterable[str]],
                 char_order: int = CHRF.CHAR_ORDER,
                 word_order: int = CHRF.WORD_ORDER,
                 beta: int = CHRF.BETA,
                 remove_whitespace: bool = True,
-                eps_smoothing: bool = False) -> CHRFScore:
+                eps_smoothing: bool = False,
+                n_jobs: int = 1) -> CHRFScore:
     """
     Computes chrF for a corpus against a single (or multiple) reference(s).
     If `word_order` equals to 2, the metric is referred to as chrF++.
 
-    :param hypotheses: A sequence of hypothesis strings.
-    :param references: A sequence of reference documents with document being
-        defined as a sequence of reference strings.
+    :param hypotheses: An iterable of hypothesis strings, e.g. a list or a generator.
+    :param references: An iterable of reference documents with document being
+        defined as an iterable of reference strings.
     :param char_order: Character n-gram order.
     :param word_order: Word n-gram order. If equals to 2, the metric is referred to as chrF++.
     :param beta: Determine the importance of recall w.r.t precision.
@@ -112,15 +159,18 @@ def corpus_chrf(hypotheses: Sequence[str],
     to reference chrF++.py, NLTK and Moses implementations. Otherwise,
     it takes into account effective match order similar to sacreBLEU < 2.0.0.
     :param remove_whitespace: If `True`, removes whitespaces prior to character n-gram extraction.
+    :param n_jobs: The number of worker processes to extract segment statistics with.
+        If 0, half of the available CPUs will be used.
     :return: A `CHRFScore` object.
     """
-    metric = CHRF(
+    metric = _get_chrf(
         char_order=char_order,
         word_order=word_order,
         beta=beta,
         whitespace=not remove_whitespace,
         eps_smoothing=eps_smoothing)
-    return metric.corpus_score(hypotheses, references)
+    hyps, refs = _as_sequences(hypotheses, references)
+    return metric.corpus_score(hyps, refs, n_jobs=n_jobs)
 
 
 def sentence_chrf(hypothesis: str,
@@ -145,7 +195,7 @@ def sentence_chrf(hypothesis: str,
     :param remove_whitespace: If `True`, removes whitespaces prior to character n-gram extraction.
     :return: A `CHRFScore` object.
     """
-    metric = CHRF(
+    metric = _get_chrf(
         char_order=char_order,
         word_order=word_order,
         beta=beta,
@@ -154,30 +204,34 @@ def sentence_chrf(hypothesis: str,
     return metric.sentence_score(hypothesis, references)
 
 
-def corpus_ter(hypotheses: Sequence[str],
-               references: Sequence[Sequence[str]],
+def corpus_ter(hypotheses: Iterable[str],
+               references: Iterable[Iterable[str]],
                normalized: bool = False,
                no_punct: bool = False,
                asian_support: bool = False,
-               case_sensitive: bool = False) -> TERScore:
+               case_sensitive: bool = False,
+               n_jobs: int = 1) -> TERScore:
     """
     Computes TER for a corpus against a single (or multiple) reference(s).
 
-    :param hypotheses: A sequence of hypothesis strings.
-    :param references: A sequence of reference documents with document being
-        defined as a sequence of reference strings.
+    :param hypotheses: An iterable of hypothesis strings, e.g. a list or a generator.
+    :param references: An iterable of reference documents with document being
+        defined as an iterable of reference strings.
     :param normalized: Enable character normalization.
     :param no_punct: Remove punctuation.
     :param asian_support: Enable special treatment of Asian characters.
     :param case_sensitive: Enables case-sensitivity.
+    :param n_jobs: The number of worker processes to extract segment statistics with.
+        If 0, half of the available CPUs will be used.
     :return: A `TERScore` object.
     """
-    metric = TER(
+    metric = _get_ter(
         normalized=normalized,
         no_punct=no_punct,
         asian_support=asian_support,
         case_sensitive=case_sensitive)
-    return metric.corpus_score(hypotheses, references)
+    hyps, refs = _as_sequences(hypotheses, references)
+    return metric.corpus_score(hyps, refs, n_jobs=n_jobs)
 
 
 def sentence_ter(hypothesis: str,
@@ -197,7 +251,7 @@ def sentence_ter(hypothesis: str,
     :param case_sensitive: Enable case-sensitivity.
     :return: A `TERScore` object.
     """
-    metric = TER(
+    metric = _get_ter(
         normalized=normalized,
         no_punct=no_punct,
         asian_support=asian_support,
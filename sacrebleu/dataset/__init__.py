@@ -66,11 +66,17 @@ _SUBSETS = {
 }
 
 SUBSETS = {
-    k: {d.split("=")[0]: d.split("=")[1] for d in v.split()}
+    k: dict(d.split("=", 1) for d in v.split())
     for (k, v) in _SUBSETS.items()
 }
-COUNTRIES = sorted(list({v.split("-")[0] for v in SUBSETS["wmt19"].values()}))
-DOMAINS = sorted(list({v.split("-")[1] for v in SUBSETS["wmt19"].values()}))
+# Tags parsed once into (country, domain, optional second country) tuples,
+# with a missing second country given as an empty string
+SUBSET_TAGS = {
+    k: {docid: (*tag.split("-", 2), "")[:3] for (docid, tag) in v.items()}
+    for (k, v) in SUBSETS.items()
+}
+COUNTRIES = sorted({t[0] for t in SUBSET_TAGS["wmt19"].values()})
+DOMAINS = sorted({t[1] for t in SUBSET_TAGS["wmt19"].values()})
 
 DATASETS = {
     # wmt
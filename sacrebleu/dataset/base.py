@@ -2,14 +2,17 @@
 The base class for all types of datasets.
 """
 import os
-import re
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from ..utils import SACREBLEU_DIR, download_file, smart_open
 
 
 class Dataset(metaclass=ABCMeta):
+    # Fixed attribute layout; subclasses declare empty __slots__ to keep it
+    __slots__ = ("name", "data", "description", "citation", "md5", "langpairs",
+                 "kwargs", "_outdir", "_outdir_prefix", "_rawdir", "_name_flat", "_data_and_md5")
+
     def __init__(
         self,
         name: str,
@@ -38,12 +41,23 @@ class Dataset(metaclass=ABCMeta):
         self.langpairs = langpairs
         self.kwargs = kwargs
 
+        # (url, md5) pairs of the archives, with None for unknown checksums
+        urls = data or []
+        md5s: Sequence[Optional[str]] = md5 or [None] * len(urls)
+        self._data_and_md5 = tuple(zip(urls, md5s))
+
         # Don't do any downloading or further processing now.
         # Only do that lazily, when asked.
 
         # where to store the dataset
         self._outdir = os.path.join(SACREBLEU_DIR, self.name)
         self._rawdir = os.path.join(self._outdir, "raw")
+        # `_outdir` plus a trailing separator, so file paths are a plain concat
+        self._outdir_prefix = os.path.join(self._outdir, "")
+
+        # file name prefix, handling the special case of subsets.
+        # e.g. "wmt21/dev" > "wmt21_dev"
+        self._name_flat = self.name.replace("/", "_")
 
     def maybe_download(self):
         """
@@ -53,14 +67,54 @@ class Dataset(metaclass=ABCMeta):
         """
         os.makedirs(self._rawdir, exist_ok=True)
 
-        expected_checksums = self.md5 if self.md5 else [None] * len(self.data)
-
-        for url, expected_md5 in zip(self.data, expected_checksums):
-            tarball = os.path.join(self._rawdir, self._get_tarball_filename(url))
+        jobs = [
+            (url, os.path.join(self._rawdir, self._get_tarball_filename(url)), expected_md5)
+            for url, expected_md5 in self._data_and_md5
+        ]
 
-            download_file(
-                url, tarball, extract_to=self._rawdir, expected_md5=expected_md5
-            )
+        if len(jobs) <= 1:
+            for url, tarball, expected_md5 in jobs:
+                download_file(
+                    url, tarball, extract_to=self._rawdir, expected_md5=expected_md5,
+                    local_copies=self._get_local_copies(url, expected_md5),
+                )
+            return
+
+        # Downloads are I/O-bound, fetch multiple archives concurrently
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = [
+                executor.submit(
+                    download_file, url, tarball,
+                    extract_to=self._rawdir, expected_md5=expected_md5,
+                    local_copies=self._get_local_copies(url, expected_md5))
+                for url, tarball, expected_md5 in jobs
+            ]
+            # Propagate any failure to the caller
+            for future in futures:
+                future.result()
+
+    def _get_local_copies(self, url, expected_md5):
+        """
+        Returns the paths where other registered datasets store the same archive.
+        Several test sets (e.g. wmt19 and wmt19/google/*) share a tarball, which
+        can then be reused instead of downloaded again.
+
+        :param url: The URL of the archive.
+        :param expected_md5: The MD5 checksum of the archive.
+        :return: a list of file paths, which may not exist yet.
+        """
+        if expected_md5 is None:
+            # Without a checksum, the copies can't be told to be the same
+            return []
+
+        from . import DATASETS
+
+        return [
+            os.path.join(dataset._rawdir, dataset._get_tarball_filename(url))
+            for dataset in DATASETS.values()
+            if dataset is not self and (url, expected_md5) in dataset._data_and_md5
+        ]
 
     @staticmethod
     def _clean(s):
@@ -70,7 +124,9 @@ class Dataset(metaclass=ABCMeta):
         :param s: The string.
         :return: A cleaned-up string.
         """
-        return re.sub(r"\s+", " ", s.strip())
+        # `str.split()` and regex `\s` agree on what counts as whitespace,
+        # so this is equivalent to `re.sub(r"\s+", " ", s.strip())`
+        return " ".join(s.split())
 
     def _get_tarball_filename(self, url):
         """
@@ -78,7 +134,7 @@ class Dataset(metaclass=ABCMeta):
         :param url: The url to download.
         :return: A name produced from the dataset identifier and the URL basename.
         """
-        return self.name.replace("/", "_") + "." + os.path.basename(url)
+        return self._name_flat + "." + os.path.basename(url)
 
     def _get_txt_file_path(self, langpair, fieldname):
         """
@@ -89,11 +145,9 @@ class Dataset(metaclass=ABCMeta):
         :param fieldname: The fieldname.
         :return: The path to the text file.
         """
-        # handle the special case of subsets. e.g. "wmt21/dev" > "wmt21_dev"
-        name = self.name.replace("/", "_")
         # Colons are used to distinguish multiple references, but are not supported in Windows filenames
         fieldname = fieldname.replace(":", "-")
-        return os.path.join(self._outdir, f"{name}.{langpair}.{fieldname}")
+        return f"{self._outdir_prefix}{self._name_flat}.{langpair}.{fieldname}"
 
     def _get_langpair_metadata(self, langpair):
         """
@@ -189,7 +243,7 @@ class Dataset(metaclass=ABCMeta):
         fields = self.fieldnames(langpair)
         files = [self._get_txt_file_path(langpair, field) for field in fields]
 
-        for file in files:
-            if not os.path.exists(file):
-                self.process_to_text(langpair)
+        # One conversion pass creates all the files of the language pair
+        if not all(os.path.exists(file) for file in files):
+            self.process_to_text(langpair)
         return files
@@ -11,17 +11,28 @@ class FakeSGMLDataset(Dataset):
     Source and reference(s) in separate files.
     """
 
+    __slots__ = ()
+
     def _convert_format(self, input_file_path, output_filep_path):
         """
         Extract data from raw file and convert to raw txt format.
         """
-        with smart_open(input_file_path) as fin, smart_open(
-            output_filep_path, "wt"
-        ) as fout:
+        segments = []
+        with smart_open(input_file_path) as fin:
             for line in fin:
                 if line.startswith("<seg "):
-                    line = self._clean(re.sub(r"<seg.*?>(.*)</seg>.*?", "\\1", line))
-                    print(line, file=fout)
+                    # Drop the tags around the payload, which runs from the
+                    # first '>' to the last '</seg>'. Lines without a closing
+                    # tag are kept as they are.
+                    gt = line.find(">", 5)
+                    end = line.rfind("</seg>")
+                    if gt != -1 and end > gt:
+                        line = line[gt + 1:end] + line[end + 6:]
+                    segments.append(self._clean(line))
+
+        # Write all segments at once rather than one print() per line
+        with smart_open(output_filep_path, "wt") as fout:
+            fout.write("".join(seg + "\n" for seg in segments))
 
     def _convert_meta(self, input_file_path, field, output_filep_path):
         """
@@ -31,15 +42,18 @@ class FakeSGMLDataset(Dataset):
             output_filep_path, "wt"
         ) as fout:
             value = ""
+            # The pattern depends on the field, compile it once per file
+            re_field = re.compile(rf'{field}="(.*?)"')
+            write = fout.write
             for line in fin:
                 if line.startswith("<doc "):
-                    match = re.search(rf'{field}="(.*?)"', line)
+                    match = re_field.search(line)
                     if match is not None:
                         value = match.group(1)
 
                 elif line.startswith("<seg "):
                     # print the current value once for each field
-                    print(value, file=fout)
+                    write(value + "\n")
 
     def process_to_text(self, langpair=None):
         """Processes raw files to plain text files.
@@ -51,19 +65,16 @@ class FakeSGMLDataset(Dataset):
         langpairs = self._get_langpair_metadata(langpair)
 
         for langpair in langpairs:
-            fieldnames = self.fieldnames(langpair)
+            # The metadata is already resolved, don't look it up again
+            fieldnames = self._fieldnames_from_paths(langpairs[langpair])
             origin_files = [
                 os.path.join(self._rawdir, path) for path in langpairs[langpair]
             ]
 
             # Add the source file three more times for docid, genre, origlang
-            origin_files += [
-                os.path.join(self._rawdir, langpairs[langpair][0]) for _ in range(3)
-            ]
+            origin_files += [origin_files[0]] * 3
 
             for field, origin_file in zip(fieldnames, origin_files):
-
-                origin_file = os.path.join(self._rawdir, origin_file)
                 output_file = self._get_txt_file_path(langpair, field)
 
                 if field.startswith("src") or field.startswith("ref"):
@@ -81,18 +92,26 @@ class FakeSGMLDataset(Dataset):
         get_files() should return the same number of items as this.
         """
         meta = self._get_langpair_metadata(langpair)
-        length = len(meta[langpair])
+        return self._fieldnames_from_paths(meta[langpair])
 
-        assert (
-            length >= 2
-        ), f"Each language pair in {self.name} must have at least 2 fields."
+    def _fieldnames_from_paths(self, paths):
+        """
+        Return the field names for a language pair given its list of raw file paths.
+
+        :param paths: The source and reference paths of the language pair.
+        :return: a list of field names
+        """
+        length = len(paths)
+
+        if length < 2:
+            raise ValueError(f"Each language pair in {self.name} must have at least 2 fields.")
 
         fields = ["src"]
 
         if length == 2:
             fields.append("ref")
         else:
-            for i, _ in enumerate(meta[langpair][1:]):
+            for i, _ in enumerate(paths[1:]):
                 fields.append(f"ref:{i}")
 
         if not self.name.startswith("wmt08"):
@@ -106,11 +125,14 @@ class WMTAdditionDataset(FakeSGMLDataset):
     Handle special case of WMT Google addition dataset.
     """
 
+    __slots__ = ()
+
     def _convert_format(self, input_file_path, output_filep_path):
         if input_file_path.endswith(".sgm"):
             return super()._convert_format(input_file_path, output_filep_path)
         else:
             with smart_open(input_file_path) as fin:
                 with smart_open(output_filep_path, "wt") as fout:
+                    write = fout.write
                     for line in fin:
-                        print(line.rstrip(), file=fout)
+                        write(line.rstrip() + "\n")
@@ -5,4 +5,4 @@ class IWSLTXMLDataset(FakeSGMLDataset):
     """IWSLT dataset format. Can be parsed with the lxml parser."""
 
     # Same as FakeSGMLDataset. Nothing to do here.
-    pass
+    __slots__ = ()
@@ -10,6 +10,8 @@ class PlainTextDataset(Dataset):
     Each line of the two files is aligned.
     """
 
+    __slots__ = ()
+
     def process_to_text(self, langpair=None):
         """Processes raw files to plain text files.
 
@@ -26,8 +28,6 @@ class PlainTextDataset(Dataset):
             ]
 
             for field, origin_file in zip(fieldnames, origin_files):
-
-                origin_file = os.path.join(self._rawdir, origin_file)
                 output_file = self._get_txt_file_path(langpair, field)
 
                 with smart_open(origin_file) as fin:
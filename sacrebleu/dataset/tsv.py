@@ -9,6 +9,8 @@ class TSVDataset(Dataset):
     The format used by the MTNT datasets. Data is in a single TSV file.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _split_index_and_filename(meta, field):
         """
@@ -41,13 +43,8 @@ class TSVDataset(Dataset):
 
         for langpair in langpairs:
             fieldnames = self.fieldnames(langpair)
-            origin_files = [
-                os.path.join(self._rawdir, path) for path in langpairs[langpair]
-            ]
 
-            for field, origin_file, meta in zip(
-                fieldnames, origin_files, langpairs[langpair]
-            ):
+            for field, meta in zip(fieldnames, langpairs[langpair]):
                 index, origin_file = self._split_index_and_filename(meta, field)
 
                 origin_file = os.path.join(self._rawdir, origin_file)
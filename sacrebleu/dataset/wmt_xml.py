@@ -1,7 +1,5 @@
 import os
 
-import lxml.etree as ET
-
 from ..utils import smart_open
 from .base import Dataset
 
@@ -19,6 +17,9 @@ class WMTXMLDataset(Dataset):
     The 2021+ WMT dataset format. Everything is contained in a single file.
     Can be parsed with the lxml parser.
     """
+
+    __slots__ = ()
+
     @staticmethod
     def _unwrap_wmt21_or_later(raw_file):
         """
@@ -35,6 +36,8 @@ class WMTXMLDataset(Dataset):
             - `ref:{translator}`: The references produced by each translator.
             - `ref`: An alias for the references from the first translator.
         """
+        # lxml is only needed once a raw XML file is actually processed
+        import lxml.etree as ET
         tree = ET.parse(raw_file)
         # Find and check the documents (src, ref, hyp)
         src_langs, ref_langs, translators = set(), set(), set()
@@ -5,6 +5,7 @@ of abstract methods. This way, a correctly implemented metric will work
 seamlessly with the rest of the codebase.
 """
 
+import os
 import json
 import logging
 import statistics
@@ -15,6 +16,29 @@ from ..version import __version__
 
 sacrelogger = logging.getLogger("sacrebleu")
 
+IS_WINDOWS = os.name == 'nt'
+
+# The (metric, hypotheses, reference cache) triplet that forked workers
+# inherit from the parent process when segment statistics are computed
+# in parallel. This avoids pickling the reference cache for each task.
+_WORKER_ARGS: Optional[tuple] = None
+
+
+def _compute_segment_statistics_chunk(start: int, end: int) -> List[Any]:
+    """Computes the statistics for the segments `[start, end)` inside a
+    worker process, using the data inherited through `_WORKER_ARGS`.
+
+    :param start: The index of the first segment.
+    :param end: The index after the last segment.
+    :return: A list of segment statistics.
+    """
+    assert _WORKER_ARGS is not None, "Worker arguments are not set"
+    metric, hypotheses, ref_cache = _WORKER_ARGS
+    return [
+        metric._compute_segment_statistics(metric._preprocess_segment(hyp), ref_kwargs)
+        for hyp, ref_kwargs in zip(hypotheses[start:end], ref_cache[start:end])
+    ]
+
 
 class Score:
     """A base score class to derive from.
@@ -356,8 +380,30 @@ class Metric(metaclass=ABCMeta):
 
         return ref_cache
 
+    @staticmethod
+    def _get_n_jobs(n_jobs: int) -> int:
+        """Decides on the number of worker processes to use.
+
+        :param n_jobs: The requested number of workers. If 0, half of the
+        available CPUs will be used.
+        :return: The final number of workers.
+        """
+        if n_jobs == 1:
+            return 1
+
+        if IS_WINDOWS:
+            sacrelogger.warning('Parallel statistics extraction is not supported on Windows.')
+            return 1
+
+        if n_jobs == 0:
+            # Divide by two to ignore hyper-threading
+            n_jobs = (os.cpu_count() or 1) // 2
+
+        return max(n_jobs, 1)
+
     def _extract_corpus_statistics(
-        self, hypotheses: Sequence[str], references: Optional[Sequence[Sequence[str]]]
+        self, hypotheses: Sequence[str], references: Optional[Sequence[Sequence[str]]],
+        n_jobs: int = 1,
     ) -> Any:
         """Reads the corpus and returns sentence-level match statistics for
         faster re-computations esp. during statistical tests.
@@ -366,6 +412,9 @@ class Metric(metaclass=ABCMeta):
         :param references: A sequence of reference documents with document being
         defined as a sequence of reference strings. If `None`, cached references
         will be used.
+        :param n_jobs: The number of worker processes to compute the segment
+        statistics with. If 0, half of the available CPUs will be used.
+        The default of 1 does not use multi-processing.
         :return: A list where each sublist corresponds to segment statistics.
         """
         # Pre-compute references
@@ -380,15 +429,42 @@ class Metric(metaclass=ABCMeta):
         stats = []
         tok_count = 0
 
-        for hyp, ref_kwargs in zip(hypotheses, ref_cache):
+        n_jobs = self._get_n_jobs(n_jobs)
+
+        if n_jobs > 1:
             # Check for already-tokenized input problem (only for BLEU)
-            if not self._force and hyp.endswith(" ."):
-                tok_count += 1
+            if not self._force:
+                tok_count = sum(1 for hyp in hypotheses if hyp.endswith(" ."))
+
+            # NOTE: This only works on Linux/Mac OS X but not Windows, as
+            # the workers rely on the `fork` backend to inherit the data.
+            import multiprocessing as mp
+            global _WORKER_ARGS
+            _WORKER_ARGS = (self, hypotheses, ref_cache)
+            n_segs = min(len(hypotheses), len(ref_cache))
+            chunk_size = -(-n_segs // n_jobs)
+            try:
+                with mp.get_context('fork').Pool(n_jobs) as pool:
+                    jobs = [
+                        pool.apply_async(
+                            _compute_segment_statistics_chunk, (i, i + chunk_size))
+                        for i in range(0, n_segs, chunk_size)]
+
+                    # Keep the segment order deterministic
+                    for job in jobs:
+                        stats.extend(job.get())
+            finally:
+                _WORKER_ARGS = None
+        else:
+            for hyp, ref_kwargs in zip(hypotheses, ref_cache):
+                # Check for already-tokenized input problem (only for BLEU)
+                if not self._force and hyp.endswith(" ."):
+                    tok_count += 1
 
-            hyp = self._preprocess_segment(hyp)
+                hyp = self._preprocess_segment(hyp)
 
-            # Collect stats
-            stats.append(self._compute_segment_statistics(hyp, ref_kwargs))
+                # Collect stats
+                stats.append(self._compute_segment_statistics(hyp, ref_kwargs))
 
         if tok_count >= 100:
             sacrelogger.warning("That's 100 lines that end in a tokenized period ('.')")
@@ -415,11 +491,36 @@ class Metric(metaclass=ABCMeta):
         )
         return self._aggregate_and_compute(stats)
 
+    def sentence_scores(
+        self,
+        hypotheses: Sequence[str],
+        references: Optional[Sequence[Sequence[str]]],
+        n_jobs: int = 1,
+    ) -> List[Any]:
+        """Compute the metric for each hypothesis against its own reference(s).
+        This is equivalent to calling `sentence_score()` for each segment but
+        reuses the reference cache and avoids the per-call overhead.
+
+        :param hypotheses: A sequence of hypothesis strings.
+        :param references: A sequence of reference documents with document being
+        defined as a sequence of reference strings, as in `corpus_score()`.
+        If `None`, cached references will be used.
+        :param n_jobs: The number of worker processes to extract segment statistics
+        with. If 0, half of the available CPUs will be used. The default of 1
+        does not use multi-processing.
+        :return: A list of `Score` objects, one per hypothesis.
+        """
+        self._check_corpus_score_args(hypotheses, references)
+
+        stats = self._extract_corpus_statistics(hypotheses, references, n_jobs)
+        return [self._aggregate_and_compute([seg_stats]) for seg_stats in stats]
+
     def corpus_score(
         self,
         hypotheses: Sequence[str],
         references: Optional[Sequence[Sequence[str]]],
         n_bootstrap: int = 1,
+        n_jobs: int = 1,
     ) -> Any:
         """Compute the metric for a corpus against a single (or multiple) reference(s).
 
@@ -429,12 +530,15 @@ class Metric(metaclass=ABCMeta):
         will be used.
         :param n_bootstrap: If > 1, provides 95% confidence interval around true mean
         using bootstrap resampling with `n_bootstrap` samples.
+        :param n_jobs: The number of worker processes to extract segment statistics
+        with. If 0, half of the available CPUs will be used. The default of 1
+        does not use multi-processing.
         :return: A `Score` object.
         """
         self._check_corpus_score_args(hypotheses, references)
 
         # Collect corpus stats
-        stats = self._extract_corpus_statistics(hypotheses, references)
+        stats = self._extract_corpus_statistics(hypotheses, references, n_jobs)
 
         # Compute the actual system score
         actual_score = self._aggregate_and_compute(stats)
@@ -394,14 +394,16 @@ class BLEU(Metric):
         # Although counter has its internal & and | operators, this is faster
         correct = [0 for i in range(self.max_ngram_order)]
         total = correct[:]
+        get_ref_count = ref_ngrams.get
         for hyp_ngram, hyp_count in hyp_ngrams.items():
             # n-gram order
             n = len(hyp_ngram) - 1
             # count hypothesis n-grams
             total[n] += hyp_count
-            # count matched n-grams
-            if hyp_ngram in ref_ngrams:
-                correct[n] += min(hyp_count, ref_ngrams[hyp_ngram])
+            # count matched n-grams (single lookup instead of `in` + `[]`)
+            ref_count = get_ref_count(hyp_ngram)
+            if ref_count:
+                correct[n] += hyp_count if hyp_count < ref_count else ref_count
 
         # Return a flattened list for efficient computation
         return [hyp_len, ref_len] + correct + total
@@ -417,3 +419,20 @@ class BLEU(Metric):
             sacrelogger.warning(
                 'It is recommended to enable `effective_order` for sentence-level BLEU.')
         return super().sentence_score(hypothesis, references)
+
+    def sentence_scores(self, hypotheses: Sequence[str],
+                        references: Optional[Sequence[Sequence[str]]],
+                        n_jobs: int = 1) -> List[BLEUScore]:
+        """Compute the metric for each hypothesis against its own reference(s).
+
+        :param hypotheses: A sequence of hypothesis strings.
+        :param references: A sequence of reference documents with document being
+        defined as a sequence of reference strings, as in `corpus_score()`.
+        If `None`, cached references will be used.
+        :param n_jobs: The number of worker processes to extract segment statistics with.
+        :return: A list of `BLEUScore` objects, one per hypothesis.
+        """
+        if not self.effective_order:
+            sacrelogger.warning(
+                'It is recommended to enable `effective_order` for sentence-level BLEU.')
+        return super().sentence_scores(hypotheses, references, n_jobs)
@@ -83,6 +83,9 @@ class CHRF(Metric):
 
     _SIGNATURE_TYPE = CHRFSignature
 
+    # Maximum number of segments whose n-grams `sentence_score()` keeps around
+    _SEGMENT_CACHE_SIZE = 2**13
+
     def __init__(self, char_order: int = CHAR_ORDER,
                  word_order: int = WORD_ORDER,
                  beta: int = BETA,
@@ -101,6 +104,9 @@ class CHRF(Metric):
         self.whitespace = whitespace
         self.eps_smoothing = eps_smoothing
 
+        # Segment n-grams memoized by `sentence_score()`
+        self._segment_cache: Dict[str, List[Counter]] = {}
+
         if references is not None:
             # Pre-compute reference ngrams
             self._ref_cache = self._cache_references(references)
@@ -114,16 +120,18 @@ class CHRF(Metric):
         :return: A list of three numbers denoting hypothesis n-gram count,
             reference n-gram count and the intersection count.
         """
-        # Counter's internal intersection is not that fast, count manually
-        match_count, hyp_count = 0, 0
+        # Counter's internal intersection is not that fast, count manually.
+        # A single `dict.get` per n-gram is cheaper than `in` + `[]`.
+        match_count = 0
+        get_ref_count = ref_ngrams.get
         for ng, count in hyp_ngrams.items():
-            hyp_count += count
-            if ng in ref_ngrams:
-                match_count += min(count, ref_ngrams[ng])
+            ref_count = get_ref_count(ng)
+            if ref_count:
+                match_count += count if count < ref_count else ref_count
 
         return [
             # Don't count hits if no reference exists for that n-gram
-            hyp_count if ref_ngrams else 0,
+            sum(hyp_ngrams.values()) if ref_ngrams else 0,
             sum(ref_ngrams.values()),
             match_count,
         ]
@@ -226,22 +234,42 @@ class CHRF(Metric):
         :param refs: A sequence of reference segments.
         :return: A list where each element contains n-grams per reference segment.
         """
-        ngrams = []
+        return {'ref_ngrams': [self._extract_segment_ngrams(ref) for ref in refs]}
+
+    def _extract_segment_ngrams(self, sent: str) -> List[Counter]:
+        """Extracts the character and word n-grams of a single segment.
+
+        :param sent: A (pre-processed) hypothesis or reference segment.
+        :return: A list of n-gram counters, one per character and word order.
+        """
+        # extract character n-grams
+        stats = extract_all_char_ngrams(sent, self.char_order, self.whitespace)
 
-        for ref in refs:
-            # extract character n-grams
-            stats = extract_all_char_ngrams(ref, self.char_order, self.whitespace)
+        # Check chrF+ mode to see if we'll add word n-grams as well
+        if self.word_order > 0:
+            # Primitive tokenization: separate out punctuations
+            words = self._remove_punctuation(sent)
 
-            # Check chrF+ mode
-            if self.word_order > 0:
-                ref_words = self._remove_punctuation(ref)
+            for n in range(1, self.word_order + 1):
+                stats.append(extract_word_ngrams(words, n))
 
-                for n in range(self.word_order):
-                    stats.append(extract_word_ngrams(ref_words, n + 1))
+        return stats
 
-            ngrams.append(stats)
+    def _get_cached_segment_ngrams(self, sent: str) -> List[Counter]:
+        """Returns the n-grams of a segment through a bounded per-instance cache,
+        so that scoring the same hypotheses or references repeatedly (e.g. with
+        `sentence_score()` over all hypothesis-reference pairs) does not
+        re-extract them. The returned counters are shared and should not be modified.
 
-        return {'ref_ngrams': ngrams}
+        :param sent: A (pre-processed) hypothesis or reference segment.
+        :return: A list of n-gram counters, one per character and word order.
+        """
+        ngrams = self._segment_cache.get(sent)
+        if ngrams is None:
+            if len(self._segment_cache) >= self._SEGMENT_CACHE_SIZE:
+                self._segment_cache.clear()
+            ngrams = self._segment_cache[sent] = self._extract_segment_ngrams(sent)
+        return ngrams
 
     def _compute_segment_statistics(
             self, hypothesis: str, ref_kwargs: Dict) -> List[int]:
@@ -255,22 +283,26 @@ class CHRF(Metric):
         :return: A list of integers where each triplet denotes [hyp, ref, match]
         statistics.
         """
+        # extract character and word n-grams
+        all_hyp_ngrams = self._extract_segment_ngrams(hypothesis)
+        return self._compute_best_statistics(all_hyp_ngrams, ref_kwargs['ref_ngrams'])
+
+    def _compute_best_statistics(
+            self, all_hyp_ngrams: List[Counter], all_ref_ngrams: List[List[Counter]]) -> List[int]:
+        """Given the n-grams of a hypothesis and of its references, returns
+        the match statistics of the reference with the best F score.
+
+        :param all_hyp_ngrams: A list of hypothesis n-gram counters, one per order.
+        :param all_ref_ngrams: A list where each sublist contains n-gram counters
+        for a particular reference sentence.
+        :return: A list of integers where each triplet denotes [hyp, ref, match]
+        statistics.
+        """
         best_stats = []
         best_f_score = -1.0
 
-        # extract character n-grams
-        all_hyp_ngrams = extract_all_char_ngrams(
-            hypothesis, self.char_order, self.whitespace)
-
-        # Check chrF+ mode to see if we'll add word n-grams as well
-        if self.word_order > 0:
-            # Primitive tokenization: separate out punctuations
-            hwords = self._remove_punctuation(hypothesis)
-            _range = range(1, self.word_order + 1)
-            all_hyp_ngrams.extend([extract_word_ngrams(hwords, n) for n in _range])
-
         # Iterate over multiple references, pick the one with best F score
-        for _ref_ngrams in ref_kwargs['ref_ngrams']:
+        for _ref_ngrams in all_ref_ngrams:
             stats = []
             # Traverse all orders
             for h, r in zip(all_hyp_ngrams, _ref_ngrams):
@@ -282,3 +314,20 @@ class CHRF(Metric):
                 best_stats = stats
 
         return best_stats
+
+    def sentence_score(self, hypothesis: str, references: Sequence[str]) -> CHRFScore:
+        """Compute chrF for a single sentence against a single (or multiple) reference(s).
+        The n-grams of each segment are cached, unlike in `corpus_score()`.
+
+        :param hypothesis: A single hypothesis string.
+        :param references: A sequence of reference strings.
+        :return: A `CHRFScore` object.
+        """
+        self._check_sentence_score_args(hypothesis, references)
+
+        all_ref_ngrams = [
+            self._get_cached_segment_ngrams(self._preprocess_segment(ref))
+            for ref in references if ref is not None]
+        stats = self._compute_best_statistics(
+            self._get_cached_segment_ngrams(self._preprocess_segment(hypothesis)), all_ref_ngrams)
+        return self._aggregate_and_compute([stats])
@@ -261,11 +261,14 @@ def main():
         sacrelogger.error('Only one metric can be used in sentence-level mode.')
         sys.exit(1)
 
+    # Multiple test sets can be given as a comma-separated list
+    test_sets = args.test_set.split(',') if args.test_set is not None else []
+
     if args.citation:
         if not args.test_set:
             sacrelogger.error('I need a test set (-t).')
             sys.exit(1)
-        for test_set in args.test_set.split(','):
+        for test_set in test_sets:
             if 'citation' not in DATASETS[test_set]:
                 sacrelogger.error(f'No citation found for {test_set}')
             else:
@@ -279,7 +282,7 @@ def main():
         sys.exit(1)
 
     if args.test_set is not None:
-        for test_set in args.test_set.split(','):
+        for test_set in test_sets:
             if test_set not in DATASETS:
                 sacrelogger.error(f'Unknown test set {test_set!r}')
                 sacrelogger.error('Please run with --list to see the available test sets.')
@@ -299,7 +302,7 @@ def main():
         sacrelogger.error('I need a language pair (-l). Use --list to see available language pairs for this test set.')
         sys.exit(1)
     else:
-        for test_set in args.test_set.split(','):
+        for test_set in test_sets:
             langpairs = get_langpairs_for_testset(test_set)
             if args.langpair not in langpairs:
                 sacrelogger.error(f'No such language pair {args.langpair!r}')
@@ -312,7 +315,7 @@ def main():
         if args.langpair is None or args.test_set is None:
             sacrelogger.warning("--echo requires a test set (--t) and a language pair (-l)")
             sys.exit(1)
-        for test_set in args.test_set.split(','):
+        for test_set in test_sets:
             print_test_set(test_set, args.langpair, args.echo, args.origlang, args.subset)
         sys.exit(0)
 
@@ -335,8 +338,7 @@ def main():
     if args.test_set is None:
         concat_ref_files.append(args.refs)
     else:
-        # Multiple test sets can be given
-        for test_set in args.test_set.split(','):
+        for test_set in test_sets:
             ref_files = get_reference_files(test_set, args.langpair)
             if len(ref_files) == 0:
                 sacrelogger.warning(
@@ -349,20 +351,20 @@ def main():
     full_refs = [[] for x in range(max(len(concat_ref_files[0]), args.num_refs))]
     for ref_files in concat_ref_files:
         for refno, ref_file in enumerate(ref_files):
-            for lineno, line in enumerate(smart_open(ref_file, encoding=args.encoding), 1):
-                line = line.rstrip()
+            with smart_open(ref_file, encoding=args.encoding) as fh:
                 if args.num_refs == 1:
-                    full_refs[refno].append(line)
+                    full_refs[refno].extend(line.rstrip() for line in fh)
                 else:
-                    refs = line.split(sep='\t', maxsplit=args.num_refs - 1)
-                    # We are strict in fixed number of references through CLI
-                    # But the API supports having variable refs per each segment
-                    # by simply having '' or None's as dummy placeholders
-                    if len(refs) != args.num_refs:
-                        sacrelogger.error(f'FATAL: line {lineno}: expected {args.num_refs} fields, but found {len(refs)}.')
-                        sys.exit(17)
-                    for refno, ref in enumerate(refs):
-                        full_refs[refno].append(ref)
+                    for lineno, line in enumerate(fh, 1):
+                        refs = line.rstrip().split(sep='\t', maxsplit=args.num_refs - 1)
+                        # We are strict in fixed number of references through CLI
+                        # But the API supports having variable refs per each segment
+                        # by simply having '' or None's as dummy placeholders
+                        if len(refs) != args.num_refs:
+                            sacrelogger.error(f'FATAL: line {lineno}: expected {args.num_refs} fields, but found {len(refs)}.')
+                            sys.exit(17)
+                        for refno, ref in enumerate(refs):
+                            full_refs[refno].append(ref)
 
     # Decide on the number of final references, override the argument
     args.num_refs = len(full_refs)
@@ -414,10 +416,8 @@ def main():
                     sys.exit(1)
 
             # Read the system
-            lines = []
-            for line in smart_open(fname, encoding=args.encoding):
-                lines.append(line.rstrip())
-            full_systems.append(lines)
+            with smart_open(fname, encoding=args.encoding) as fh:
+                full_systems.append([line.rstrip() for line in fh])
             sys_names.append(sys_name)
 
         # Set final number of systems
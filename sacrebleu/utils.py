@@ -7,12 +7,11 @@ import gzip
 import math
 import hashlib
 import logging
-import portalocker
 from collections import defaultdict
-from typing import List, Optional, Sequence, Dict
+from functools import lru_cache
+from typing import List, Optional, Sequence, Dict, Tuple
 from argparse import Namespace
 
-from tabulate import tabulate
 import colorama
 
 
@@ -27,10 +26,18 @@ SACREBLEU_DIR = os.environ.get('SACREBLEU', os.path.join(USERHOME, '.sacrebleu')
 
 sacrelogger = logging.getLogger('sacrebleu')
 
+# Document attributes in the raw SGM files
+_ORIGLANG_RE = re.compile(r' origlang="([^"]+)"')
+_DOCID_RE = re.compile(r' docid="([^"]+)"')
+
 
 class Color:
     ENABLE_COLORS = True
 
+    # Precomputed ANSI escape sequences keyed by lowercased color name
+    _ANSI_CODES = {name.lower(): code for name, code in vars(colorama.Fore).items()}
+    _RESET = colorama.Style.RESET_ALL
+
     @staticmethod
     def format(msg: str, color: str) -> str:
         """Returns a colored version of the given message string.
@@ -41,9 +48,9 @@ class Color:
         """
         if not Color.ENABLE_COLORS:
             return msg
-        _ansi_str = getattr(colorama.Fore, color.upper(), None)
+        _ansi_str = Color._ANSI_CODES.get(color.lower())
         if _ansi_str:
-            return f'{_ansi_str}{msg}{colorama.Style.RESET_ALL}'
+            return f'{_ansi_str}{msg}{Color._RESET}'
 
         return msg
 
@@ -136,6 +143,7 @@ def print_results_table(results: dict, signatures: dict, args: Namespace):
         new_dict[Color.format(name, 'cyan')] = results[name]
 
     # Finally tabulate
+    from tabulate import tabulate
     table = tabulate(
         new_dict, headers='keys', tablefmt=tablefmt,
         colalign=('right', ),
@@ -395,14 +403,31 @@ def extract_tarball(filepath, destdir):
 
 def get_md5sum(dest_path):
     # Check md5sum
-    md5 = hashlib.md5()
     with open(dest_path, 'rb') as infile:
-        for line in infile:
-            md5.update(line)
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: hash the whole file in C with a reused buffer
+            return hashlib.file_digest(infile, 'md5').hexdigest()
+
+        md5 = hashlib.md5()
+        # Fixed-size blocks instead of "lines" of a binary archive
+        for block in iter(lambda: infile.read(2**18), b''):
+            md5.update(block)
     return md5.hexdigest()
 
 
-def download_file(source_path, dest_path, extract_to=None, expected_md5=None):
+def _link_or_copy(src, dest):
+    """Hard-links `src` to `dest`, falling back to a copy (e.g. across file systems)."""
+    import shutil
+
+    if os.path.exists(dest):
+        os.remove(dest)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def download_file(source_path, dest_path, extract_to=None, expected_md5=None, local_copies=()):
     """Downloading utility.
 
     Downloads the specified test to the system location specified by the SACREBLEU environment variable.
@@ -411,10 +436,13 @@ def download_file(source_path, dest_path, extract_to=None, expected_md5=None):
     :param dest_path: where to save the file
     :param extract_to: for tarballs, where to extract to
     :param expected_md5: the MD5 sum
+    :param local_copies: paths where the same file may already have been downloaded,
+        used instead of fetching `source_path` again
     :return: the set of processed file names
     """
     import urllib.request
     import ssl
+    import portalocker
 
     outdir = os.path.dirname(dest_path)
     os.makedirs(outdir, exist_ok=True)
@@ -424,19 +452,49 @@ def download_file(source_path, dest_path, extract_to=None, expected_md5=None):
     with portalocker.Lock(lockfile, timeout=60):
 
         if not os.path.exists(dest_path) or os.path.getsize(dest_path) == 0:
-            sacrelogger.info(f"Downloading {source_path} to {dest_path}")
-
-            try:
-                with urllib.request.urlopen(source_path) as f, open(dest_path, 'wb') as out:
-                    out.write(f.read())
-            except ssl.SSLError:
-                sacrelogger.error('An SSL error was encountered in downloading the files. If you\'re on a Mac, '
-                                    'you may need to run the "Install Certificates.command" file located in the '
-                                    '"Python 3" folder, often found under /Applications')
-                sys.exit(1)
+            local_copy = next(
+                (path for path in local_copies if os.path.exists(path) and os.path.getsize(path) > 0), None)
+
+            cur_md5 = None
+            if local_copy is not None:
+                sacrelogger.info(f"Reusing {local_copy} for {dest_path}")
+                _link_or_copy(local_copy, dest_path)
+                if expected_md5 is not None:
+                    cur_md5 = get_md5sum(dest_path)
+                    if cur_md5 != expected_md5:
+                        # Don't keep a corrupt copy around, fetch the original instead
+                        sacrelogger.warning(f'MD5 sum of {local_copy!r} was incorrect, downloading {source_path} instead.')
+                        os.remove(dest_path)
+                        local_copy = None
+
+            if local_copy is None:
+                sacrelogger.info(f"Downloading {source_path} to {dest_path}")
+
+                # Hash the blocks as they arrive instead of re-reading the file,
+                # and only move it into place once it is complete
+                md5 = hashlib.md5()
+                part_path = f"{dest_path}.part"
+                try:
+                    with urllib.request.urlopen(source_path) as f, open(part_path, 'wb') as out:
+                        for block in iter(lambda: f.read(2**20), b''):
+                            md5.update(block)
+                            out.write(block)
+                except BaseException as e:
+                    # Don't leave a partial download behind
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    if isinstance(e, ssl.SSLError):
+                        sacrelogger.error('An SSL error was encountered in downloading the files. If you\'re on a Mac, '
+                                          'you may need to run the "Install Certificates.command" file located in the '
+                                          '"Python 3" folder, often found under /Applications')
+                        sys.exit(1)
+                    raise
+                os.replace(part_path, dest_path)
+                cur_md5 = md5.hexdigest()
 
             if expected_md5 is not None:
-                cur_md5 = get_md5sum(dest_path)
+                if cur_md5 is None:
+                    cur_md5 = get_md5sum(dest_path)
                 if cur_md5 != expected_md5:
                     sacrelogger.error(f'Fatal: MD5 sum of downloaded file was incorrect (got {cur_md5}, expected {expected_md5}).')
                     sacrelogger.error(f'Please manually delete {dest_path!r} and rerun the command.')
@@ -488,6 +546,37 @@ def get_available_testsets_for_langpair(langpair: str) -> List[str]:
     return testsets
 
 
+@lru_cache(maxsize=None)
+def _parse_sgm_docs(rawfile: str) -> Tuple[Tuple[Optional[str], Optional[str], int], ...]:
+    """Reads a raw SGM file once and returns the `origlang` and `docid`
+    attributes of each document along with its number of segments. The result
+    is cached so that repeated subset filtering (e.g. in `--detail` mode)
+    does not re-read the file.
+
+    :param rawfile: The path to the raw SGM file.
+    :return: A tuple of `(origlang, docid, n_segs)` tuples, one per document.
+        Segments found before the first document are counted in a leading
+        `(None, None, n_segs)` entry.
+    """
+    docs: List[Tuple[Optional[str], Optional[str]]] = []
+    seg_counts: List[int] = []
+    with smart_open(rawfile) as fin:
+        for line in fin:
+            if line.startswith('<doc '):
+                match = _ORIGLANG_RE.search(line)
+                origlang = match.group(1) if match else None
+                match = _DOCID_RE.search(line)
+                doc_id = match.group(1) if match else ''
+                docs.append((origlang, doc_id))
+                seg_counts.append(0)
+            elif line.startswith('<seg '):
+                if not docs:
+                    docs.append((None, None))
+                    seg_counts.append(0)
+                seg_counts[-1] += 1
+    return tuple((origlang, doc_id, n_segs) for (origlang, doc_id), n_segs in zip(docs, seg_counts))
+
+
 def get_available_origlangs(test_sets, langpair) -> List[str]:
     """Return a list of origlang values according to the raw XML/SGM files."""
     if test_sets is None:
@@ -502,12 +591,10 @@ def get_available_origlangs(test_sets, langpair) -> List[str]:
             for origlang in dataset._unwrap_wmt21_or_later(rawfile)['origlang']:
                 origlangs.add(origlang)
         if rawfile.endswith('.sgm'):
-            with smart_open(rawfile) as fin:
-                for line in fin:
-                    if line.startswith('<doc '):
-                        doc_origlang = re.sub(r'.* origlang="([^"]+)".*\n', '\\1', line)
-                        origlangs.add(doc_origlang)
-    return sorted(list(origlangs))
+            for origlang, _, _ in _parse_sgm_docs(rawfile):
+                if origlang is not None:
+                    origlangs.add(origlang)
+    return sorted(origlangs)
 
 
 def get_available_subsets(test_sets, langpair) -> List[str]:
@@ -524,23 +611,30 @@ def get_available_subsets(test_sets, langpair) -> List[str]:
             fields = dataset._unwrap_wmt21_or_later(rawfile)
             if 'domain' in fields:
                 subsets |= set(fields['domain'])
-        elif test_set in SUBSETS:
-            subsets |= set("country:" + v.split("-")[0] for v in SUBSETS[test_set].values())
-            subsets |= set(v.split("-")[1] for v in SUBSETS[test_set].values())
-    return sorted(list(subsets))
+        elif test_set in SUBSET_TAGS:
+            subsets |= set("country:" + t[0] for t in SUBSET_TAGS[test_set].values())
+            subsets |= set(t[1] for t in SUBSET_TAGS[test_set].values())
+    return sorted(subsets)
 
 def filter_subset(systems, test_sets, langpair, origlang, subset=None):
     """Filter sentences with a given origlang (or subset) according to the raw SGM files."""
     if origlang is None and subset is None:
         return systems
+    indices_to_keep = get_subset_mask(test_sets, langpair, origlang, subset)
+    return [[sentence for sentence, keep in zip(sys, indices_to_keep) if keep] for sys in systems]
+
+
+def get_subset_mask(test_sets, langpair, origlang, subset=None) -> List[bool]:
+    """Return a boolean mask over the segments of the given test set(s), marking
+    the ones that match a given origlang (or subset) according to the raw SGM files."""
     if test_sets is None or langpair is None:
         raise ValueError('Filtering for --origlang or --subset needs a test (-t) and a language pair (-l).')
 
     if subset is not None and subset.startswith('country:'):
         subset = subset[8:]
 
-    re_origlang = re.compile(r'.* origlang="([^"]+)".*\n')
-    re_id = re.compile(r'.* docid="([^"]+)".*\n')
+    # Compile the user-provided pattern once rather than for each document
+    re_subset = re.compile(subset) if subset is not None else None
 
     indices_to_keep = []
     for test_set in test_sets.split(','):
@@ -558,7 +652,7 @@ def filter_subset(systems, test_sets, langpair, origlang, subset=None):
                         include_doc = doc_origlang != origlang[4:]
                     else:
                         include_doc = doc_origlang == origlang
-                if subset is not None and (doc_domain is None or not re.search(subset, doc_domain)):
+                if re_subset is not None and (doc_domain is None or not re_subset.search(doc_domain)):
                     include_doc = False
                 indices_to_keep.append(include_doc)
         elif rawfile.endswith('.sgm'):
@@ -567,28 +661,23 @@ def filter_subset(systems, test_sets, langpair, origlang, subset=None):
                 if test_set not in SUBSETS:
                     raise Exception('No subset annotation available for test set ' + test_set)
                 doc_to_tags = SUBSETS[test_set]
-            with smart_open(rawfile) as fin:
-                include_doc = False
-                for line in fin:
-                    if line.startswith('<doc '):
-                        if origlang is None:
-                            include_doc = True
-                        else:
-                            doc_origlang = re_origlang.sub(r'\1', line)
-                            if origlang.startswith('non-'):
-                                include_doc = doc_origlang != origlang[4:]
-                            else:
-                                include_doc = doc_origlang == origlang
-
-                        if subset is not None:
-                            doc_id = re_id.sub(r'\1', line)
-                            if not re.search(subset, doc_to_tags.get(doc_id, '')):
-                                include_doc = False
-                    if line.startswith('<seg '):
-                        indices_to_keep.append(include_doc)
+            for doc_origlang, doc_id, n_segs in _parse_sgm_docs(rawfile):
+                if doc_id is None:
+                    # Segments outside of any document are never kept
+                    include_doc = False
+                elif origlang is None:
+                    include_doc = True
+                elif origlang.startswith('non-'):
+                    include_doc = doc_origlang != origlang[4:]
+                else:
+                    include_doc = doc_origlang == origlang
+
+                if re_subset is not None and not re_subset.search(doc_to_tags.get(doc_id or '', '')):
+                    include_doc = False
+                indices_to_keep.extend([include_doc] * n_segs)
         else:
             raise Exception(f'--origlang and --subset supports only WMT *.xml and *.sgm files, not {rawfile!r}')
-    return [[sentence for sentence, keep in zip(sys, indices_to_keep) if keep] for sys in systems]
+    return indices_to_keep
 
 
 def print_subset_results(metrics, full_system, full_refs, args):
@@ -600,20 +689,27 @@ def print_subset_results(metrics, full_system, full_refs, args):
         print('No subset information found. Consider using --origlang argument.')
         return
 
+    subsets = [None]
+    if args.subset is not None:
+        subsets += [args.subset]
+    else:
+        subsets += get_available_subsets(args.test_set, args.langpair)
+
     results = defaultdict(list)
 
-    for origlang in origlangs:
-        subsets = [None]
-        if args.subset is not None:
-            subsets += [args.subset]
-        else:
-            subsets += get_available_subsets(args.test_set, args.langpair)
+    # Extract segment-level statistics once over the full test set and only
+    # aggregate the relevant segments for each origlang/subset combination,
+    # instead of re-tokenizing the same segments for every combination.
+    full_stats = {
+        name: metric._extract_corpus_statistics(full_system, full_refs)
+        for name, metric in metrics.items()}
 
+    for origlang in origlangs:
         for subset in subsets:
-            system, *refs = filter_subset(
-                [full_system, *full_refs], args.test_set, args.langpair, origlang, subset)
+            mask = get_subset_mask(args.test_set, args.langpair, origlang, subset)
+            n_system = sum(mask)
 
-            if len(system) == 0:
+            if n_system == 0:
                 continue
 
             key = f'origlang={origlang}'
@@ -624,16 +720,21 @@ def print_subset_results(metrics, full_system, full_refs, args):
             else:
                 key += f' domain={subset}'
 
-            for metric in metrics.values():
-                score = metric.corpus_score(system, refs)
-                results[key].append((len(system), score))
+            for name, metric in metrics.items():
+                stats = [seg for seg, keep in zip(full_stats[name], mask) if keep]
+                score = metric._aggregate_and_compute(stats)
+                results[key].append((n_system, score))
 
     max_left_width = max([len(k) for k in results.keys()]) + 1
     max_metric_width = max([len(val[1].name) for val in list(results.values())[0]])
+    lines = []
     for key, scores in results.items():
         key = Color.format(f'{key:<{max_left_width}}', 'yellow')
         for n_system, score in scores:
-            print(f'{key}: sentences={n_system:<6} {score.name:<{max_metric_width}} = {score.score:.{w}f}')
+            lines.append(f'{key}: sentences={n_system:<6} {score.name:<{max_metric_width}} = {score.score:.{w}f}')
+
+    # Emit the whole table with a single write
+    print('\n'.join(lines))
 
 # import at the end to avoid circular import
-from .dataset import DATASETS, SUBSETS  # noqa: E402
+from .dataset import DATASETS, SUBSETS, SUBSET_TAGS  # noqa: E402
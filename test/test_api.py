@@ -11,10 +11,13 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import os
+
 import pytest
 
+from sacrebleu.metrics import BLEU, CHRF, TER
 from sacrebleu.utils import get_available_testsets, get_available_testsets_for_langpair, get_langpairs_for_testset
-from sacrebleu.utils import get_source_file, get_reference_files
+from sacrebleu.utils import get_source_file, get_reference_files, _parse_sgm_docs
 from sacrebleu.dataset import DATASETS
 
 test_api_get_data = [
@@ -85,3 +88,24 @@ def test_api_get_langpairs_for_testset():
             else:
                 assert langpair in available
             assert "slashdot_" + langpair not in available
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Parallel statistics need the fork backend')
+@pytest.mark.parametrize("metric_cls", [BLEU, CHRF, TER])
+def test_api_parallel_corpus_statistics(metric_cls):
+    hyps = [f"the {i} cats sat on a mat {i % 7} ." for i in range(100)]
+    refs = [[f"the cat {i} sat on the mat {i % 5} ." for i in range(100)]]
+    metric = metric_cls(references=refs)
+    serial = metric._extract_corpus_statistics(hyps, None)
+    assert metric._extract_corpus_statistics(hyps, None, n_jobs=3) == serial
+    assert metric.corpus_score(hyps, None, n_jobs=2).score == \
+        metric.corpus_score(hyps, None).score
+
+
+def test_api_parse_sgm_docs(tmp_path):
+    rawfile = tmp_path / "test.sgm"
+    rawfile.write_text(
+        '<seg id="0">stray</seg>\n'
+        '<doc sysid="ref" docid="a" origlang="de">\n<seg id="1">x</seg>\n<seg id="2">y</seg>\n</doc>\n'
+        '<doc sysid="ref" docid="b">\n<seg id="1">z</seg>\n</doc>\n')
+    assert _parse_sgm_docs(str(rawfile)) == ((None, None, 1), ("de", "a", 2), (None, "b", 1))
@@ -90,6 +90,14 @@ def test_corpus_bleu(hypotheses, references, kwargs, expected_bleu):
     assert abs(bleu - expected_bleu) < EPSILON
 
 
+@pytest.mark.parametrize("hypotheses, references, kwargs, expected_bleu", test_corpus_bleu_cases)
+def test_corpus_bleu_generators(hypotheses, references, kwargs, expected_bleu):
+    bleu = sacrebleu.corpus_bleu(
+        (hyp for hyp in hypotheses), ((ref for ref in refs) for refs in references),
+        **kwargs).score
+    assert abs(bleu - expected_bleu) < EPSILON
+
+
 @pytest.mark.parametrize("hypotheses, references, expected_bleu", test_case_effective_order)
 def test_effective_order(hypotheses, references, expected_bleu):
     bleu = sacrebleu.raw_corpus_bleu(hypotheses, references, .01).score / 100
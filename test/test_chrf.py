@@ -109,3 +109,32 @@ def test_chrf_keep_whitespace(hypotheses, references, expected_score):
 def test_chrf_sentence_level(hypothesis, references, expected_score):
     score = sacrebleu.sentence_chrf(hypothesis, references, eps_smoothing=True).score
     assert abs(score - expected_score) < EPSILON
+
+
+def test_chrf_sentence_level_repeated():
+    # Segment n-grams are cached across calls, scores should not drift
+    chrf = sacrebleu.metrics.CHRF(word_order=2)
+    hyps = ['a b c', 'the cat sat .', 'a b c']
+    refs = ['a b c', 'the cat sat on the mat .']
+    scores = [chrf.sentence_score(h, [r]).score for h in hyps for r in refs]
+    assert scores == [chrf.sentence_score(h, [r]).score for h in hyps for r in refs]
+    assert scores[:2] == scores[4:]
+    assert scores[0] == 100.0
+
+
+@pytest.mark.parametrize("line", ["a b\tc\n", "a\x1cb\x0bc\x0c", "Grüße  aus Köln", ""])
+def test_chrf_remove_whitespace(line):
+    from sacrebleu.metrics.helpers import _remove_whitespace
+    assert _remove_whitespace(line) == ''.join(line.split())
+
+
+def test_chrf_instance_freed():
+    import gc
+    import weakref
+    chrf = sacrebleu.metrics.CHRF(word_order=2)
+    chrf.sentence_score('a b c', ['a b d'])
+    chrf.corpus_score(['a b c'], [['a b d']])
+    ref = weakref.ref(chrf)
+    del chrf
+    gc.collect()
+    assert ref() is None
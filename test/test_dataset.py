@@ -2,6 +2,8 @@ import os
 import shutil
 import random
 
+import pytest
+
 import sacrebleu.dataset as dataset
 from sacrebleu.utils import smart_open
 
@@ -112,3 +114,104 @@ def test_wmt22_references():
             assert wmt22._get_langpair_allowed_refs(langpair) == ["ref:A"]
 
 
+def test_subset_tags():
+    for test_set, doc_to_tags in dataset.SUBSETS.items():
+        for docid, tag in doc_to_tags.items():
+            country, domain, country2 = dataset.SUBSET_TAGS[test_set][docid]
+            assert "-".join(filter(None, (country, domain, country2))) == tag
+
+
+def test_fake_sgml_convert_format(tmp_path):
+    raw = tmp_path / "test.sgm"
+    raw.write_text(
+        '<doc docid="d1">\n'
+        '<seg id="1">Hello   world </seg>\n'
+        '<seg id="2"></seg>\n'
+        '<seg id="3">a <b>bold</b> x</seg> tail\n'
+        '<seg id="4">unterminated\n'
+        '</doc>\n'
+    )
+    out = tmp_path / "test.txt"
+    ds = dataset.FakeSGMLDataset("test", data=[], langpairs={})
+    ds._convert_format(str(raw), str(out))
+    assert out.read_text().split("\n") == [
+        "Hello world", "", "a <b>bold</b> x tail", '<seg id="4">unterminated', ""]
+
+
+@pytest.fixture
+def local_archive(tmp_path):
+    """A tarball with a single `test.txt` file, as its `(url, md5)` pair."""
+    import tarfile
+    from sacrebleu.utils import get_md5sum
+
+    (tmp_path / "test.txt").write_text("hello\n")
+    archive = tmp_path / "test.tgz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(tmp_path / "test.txt", arcname="test.txt")
+    return archive.as_uri(), get_md5sum(str(archive))
+
+
+@pytest.fixture
+def local_dataset(tmp_path, monkeypatch, local_archive):
+    """Registers datasets of the local archive, with their raw data under `tmp_path`."""
+    url, md5 = local_archive
+
+    def make(name):
+        ds = dataset.PlainTextDataset(name, data=[url], md5=[md5], langpairs={})
+        ds._rawdir = str(tmp_path / name / "raw")
+        monkeypatch.setitem(dataset.DATASETS, name, ds)
+        return ds
+
+    return make
+
+
+def test_reuse_shared_archive(tmp_path, local_dataset):
+    first, second = local_dataset("first"), local_dataset("second")
+
+    first.maybe_download()
+    # the second dataset must not need the original URL anymore
+    (tmp_path / "test.tgz").unlink()
+    second.maybe_download()
+    assert (tmp_path / "second" / "raw" / "test.txt").read_text() == "hello\n"
+
+
+def test_skip_corrupt_shared_archive(tmp_path, local_dataset):
+    local_dataset("first")
+    second = local_dataset("second")
+
+    corrupt = tmp_path / "first" / "raw" / "first.test.tgz"
+    corrupt.parent.mkdir(parents=True)
+    corrupt.write_bytes(b"corrupt")
+    # the bad copy is skipped in favour of the original URL
+    second.maybe_download()
+    assert (tmp_path / "second" / "raw" / "test.txt").read_text() == "hello\n"
+    assert corrupt.read_bytes() == b"corrupt"
+
+
+def test_maybe_download_after_removal(tmp_path, local_dataset):
+    ds = local_dataset("local")
+
+    ds.maybe_download()
+    # a cleared cache has to be fetched again
+    shutil.rmtree(ds._rawdir)
+    ds.maybe_download()
+    assert (tmp_path / "local" / "raw" / "test.txt").read_text() == "hello\n"
+
+
+def test_download_failure_leaves_no_partial_file(tmp_path, monkeypatch):
+    import io
+    import urllib.request
+    from urllib.error import URLError
+    from sacrebleu.utils import download_file
+
+    class BrokenResponse(io.BytesIO):
+        def read(self, size=-1):
+            if self.tell():
+                raise URLError("connection reset")
+            return super().read(1)
+
+    monkeypatch.setattr(urllib.request, "urlopen", lambda url: BrokenResponse(b"data"))
+    dest = tmp_path / "raw" / "test.tgz"
+    with pytest.raises(URLError):
+        download_file("https://example.com/test.tgz", str(dest))
+    assert sorted(os.listdir(tmp_path / "raw")) == ["test.tgz.lock"]
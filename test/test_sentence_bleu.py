@@ -70,3 +70,26 @@ def test_api_sentence_bleu_zero(smooth_method, smooth_value, lowercase, tok, exp
         effective_order=True)
     score = metric.sentence_score(SYS_0, [REF_0])
     assert abs(score.score - expected_score) < EPSILON
+
+
+def test_compat_sentence_bleu_reuses_metric():
+    from sacrebleu.compat import _get_bleu
+    _get_bleu.cache_clear()
+    scores = [sacrebleu.sentence_bleu(SYS, [REF]).score for _ in range(3)]
+    assert len(set(scores)) == 1
+    assert _get_bleu.cache_info().currsize == 1
+    # A different configuration gets its own metric object
+    sacrebleu.sentence_bleu(SYS, [REF], lowercase=True)
+    assert _get_bleu.cache_info().currsize == 2
+
+
+@pytest.mark.parametrize("metric_cls", [
+    lambda: sacrebleu.metrics.BLEU(effective_order=True),
+    sacrebleu.metrics.CHRF, sacrebleu.metrics.TER])
+def test_api_sentence_scores(metric_cls):
+    metric = metric_cls()
+    hyps = [SYS, SYS_0, 'a b c']
+    refs = [[REF, REF_0, 'a b d'], [REF_0, REF, 'a b c']]
+    expected = [metric.sentence_score(hyp, list(hyp_refs)).score
+                for hyp, *hyp_refs in zip(hyps, *refs)]
+    assert [s.score for s in metric.sentence_scores(hyps, refs)] == expected